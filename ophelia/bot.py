@@ -52,8 +52,13 @@ def construct_mapping(self, node, deep=False) -> dict:
     }
 
 
-yaml.SafeLoader.construct_mapping_org = yaml.SafeLoader.construct_mapping
-yaml.SafeLoader.construct_mapping = construct_mapping
+# The libyaml loader is patched as well for modules that use it
+for safe_loader in (
+        [yaml.SafeLoader, yaml.CSafeLoader] if yaml.__with_libyaml__
+        else [yaml.SafeLoader]
+):
+    safe_loader.construct_mapping_org = safe_loader.construct_mapping
+    safe_loader.construct_mapping = construct_mapping
 
 
 # Actual bot stuff starts here
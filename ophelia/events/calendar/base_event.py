@@ -320,10 +320,7 @@ class BaseEvent:
         :param colour: Embed Colour
         :return: Ongoing event embed
         """
-        return await self.get_event_embed(
-            disp_str("events_embed_ongoing").format(self.desc),
-            colour
-        )
+        return await self.get_event_embed(self.desc, colour)
 
     async def get_approval_embed(
             self,
@@ -358,9 +355,7 @@ class BaseEvent:
             the events ping)
         :param channel: Channel to send message to
         """
-        message_preamble = self.format_vars(
-            disp_str("events_ongoing_message").format(notif_message)
-        )
+        message_preamble = self.format_vars(notif_message)
 
         embed = await self.get_ongoing_embed()
 
@@ -380,11 +375,10 @@ class BaseEvent:
         :param notif_msg: Notification message format
         :param organizer_msg: Organizer notification message format
         """
-        message_preamble = disp_str("events_dm_notif").format(notif_msg)
         embed = await self.get_calendar_embed()
 
         for member in self.notif_list:
-            member_preamble = self.format_vars(message_preamble, member)
+            member_preamble = self.format_vars(notif_msg, member)
             await send_message(
                 channel=member,
                 text=member_preamble,
@@ -393,9 +387,7 @@ class BaseEvent:
 
         await send_message(
             channel=self.organizer,
-            text=self.format_vars(
-                disp_str("events_dm_notif").format(organizer_msg)
-            ),
+            text=self.format_vars(organizer_msg),
             embed=embed
         )
 
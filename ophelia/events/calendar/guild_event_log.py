@@ -2,7 +2,9 @@
 
 import asyncio
 import copy
-from typing import Any, Callable, Dict, List, Optional, Union
+import itertools
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from discord import (
     Colour, Embed, Forbidden, Guild, HTTPException, Member, Message,
@@ -26,6 +28,7 @@ from ophelia.output.output import (
     send_simple_embed
 )
 from ophelia.utils.discord_utils import FETCH_FAIL_EXCEPTIONS
+from ophelia.utils.time_utils import utc_time_now
 
 EVENT_TYPES = {
     MemberEvent.config_name(): MemberEvent,
@@ -34,6 +37,11 @@ EVENT_TYPES = {
 
 DEFAULT_EVENT_TIMEOUT = 10 * 60 * 60  # 10 Hours
 
+# Event index buckets
+APPROVAL_BUCKET = "approval"
+UPCOMING_BUCKET = "upcoming"
+ONGOING_BUCKET = "ongoing"
+
 
 class GuildEventInvalidConfig(Exception):
     """When guild event log was configured wrongly."""
@@ -66,6 +74,8 @@ class GuildEventLog:
     - ongoing_events: Ongoing events
     - approval_edits: Event edits pending approval
     - event_timeout: Seconds for an ongoing event to timeout
+    - event_index: Bucket and event of every approval, upcoming and
+        ongoing event, indexed by message ID
     """
 
     __slots__ = [
@@ -85,7 +95,9 @@ class GuildEventLog:
         "upcoming_events",
         "ongoing_events",
         "approval_edits",
-        "event_timeout"
+        "event_timeout",
+        "event_index",
+        "next_check_time"
     ]
 
     def __init__(self, guild_config_dict: dict) -> None:
@@ -129,6 +141,14 @@ class GuildEventLog:
             self.upcoming_events = None
             self.ongoing_events = None
             self.approval_edits = None
+            self.event_index: Dict[
+                int,
+                Tuple[str, Union[BaseEvent, OngoingEvent]]
+            ] = {}
+
+            # Earliest UNIX timestamp at which any upcoming or ongoing
+            # event needs to be checked; 0 forces the first check.
+            self.next_check_time: float = 0
 
         except (EventLoadError, KeyError, ValueError) as e:
             raise GuildEventInvalidConfig from e
@@ -211,6 +231,7 @@ class GuildEventLog:
                 guild_config_dict["approval_edits"]
             )
 
+            guild_log.rebuild_event_index()
             return guild_log
 
         except (
@@ -247,6 +268,7 @@ class GuildEventLog:
             guild_log.ongoing_events = guild_config_dict["ongoing_events"]
             guild_log.approval_edits = guild_config_dict["approval_edits"]
 
+            guild_log.rebuild_event_index()
             return guild_log
 
         except (
@@ -254,6 +276,96 @@ class GuildEventLog:
         ) as e:
             raise GuildEventInvalidConfig from e
 
+    def rebuild_event_index(self) -> None:
+        """Rebuild the event index from the three event dictionaries."""
+        self.event_index.clear()
+        for bucket, event_dict in (
+                (APPROVAL_BUCKET, self.approval_events),
+                (UPCOMING_BUCKET, self.upcoming_events),
+                (ONGOING_BUCKET, self.ongoing_events)
+        ):
+            for message_id, event in event_dict.items():
+                self.event_index[message_id] = (bucket, event)
+
+    @staticmethod
+    def event_check_time(event: Union[BaseEvent, OngoingEvent]) -> float:
+        """
+        Get the earliest time at which an event needs to be checked by
+        the periodic event checks.
+
+        :param event: Upcoming or ongoing event
+        :return: UNIX timestamp of the next check
+        """
+        if isinstance(event, OngoingEvent):
+            return event.countdown_time + event.timeout_length
+
+        if isinstance(event, RecurringEvent) and event.notified:
+            return event.start_time
+
+        return event.notif_time
+
+    def schedule_check(self, event: Union[BaseEvent, OngoingEvent]) -> None:
+        """
+        Bring the next check time forward for a new or edited event.
+
+        :param event: Upcoming or ongoing event
+        """
+        self.next_check_time = min(
+            self.next_check_time,
+            self.event_check_time(event)
+        )
+
+    def refresh_check_time(self) -> None:
+        """Recompute the next check time from all events in the log."""
+        self.next_check_time = min(
+            (
+                self.event_check_time(event)
+                for event in itertools.chain(
+                    self.upcoming_events.values(),
+                    self.ongoing_events.values()
+                )
+            ),
+            default=math.inf
+        )
+
+    def checks_due(self) -> bool:
+        """
+        Check if any event in the log might need to be checked.
+
+        :return: Boolean indicating if the periodic checks should run
+        """
+        return utc_time_now().timestamp() >= self.next_check_time
+
+    def event_dicts(self) -> Dict[str, dict]:
+        """
+        Get the event and edit dictionaries of this log, without
+        copying them, keyed by their guild config names.
+
+        :return: Dictionary of event and edit dictionaries
+        """
+        return {
+            "approval_events": self.approval_events,
+            "upcoming_events": self.upcoming_events,
+            "ongoing_events": self.ongoing_events,
+            "approval_edits": self.approval_edits
+        }
+
+    async def remove_event(self, message_id: int) -> None:
+        """
+        Reject, delete or end an event by message ID, depending on
+        which stage the event is in.
+
+        :param message_id: Message ID of the approval, calendar or
+            ongoing event message
+        """
+        bucket, _ = self.event_index.get(message_id, (None, None))
+        if bucket == APPROVAL_BUCKET:
+            await self.reject_event(message_id)
+        elif bucket == UPCOMING_BUCKET:
+            await self.delete_upcoming_event(message_id)
+        elif bucket == ONGOING_BUCKET:
+            await self.end_ongoing_event(message_id)
+
     @staticmethod
     async def load_event(event_dict: dict, guild: Guild) -> BaseEvent:
         """
@@ -431,6 +543,8 @@ class GuildEventLog:
 
         await message.add_reaction(NOTIF_EMOTE)
         self.upcoming_events[message.id] = event
+        self.event_index[message.id] = (UPCOMING_BUCKET, event)
+        self.schedule_check(event)
 
     async def update_ongoing_event(
             self,
@@ -448,6 +562,8 @@ class GuildEventLog:
         )
 
         self.ongoing_events[message.id] = ongoing_event
+        self.event_index[message.id] = (ONGOING_BUCKET, ongoing_event)
+        self.schedule_check(ongoing_event)
 
     async def update_new_approval_event(
             self,
@@ -467,6 +583,7 @@ class GuildEventLog:
         await message.add_reaction(APPROVE_EMOTE)
         await message.add_reaction(REJECT_EMOTE)
         self.approval_events[message.id] = event
+        self.event_index[message.id] = (APPROVAL_BUCKET, event)
 
     async def submit_event(self, args_dict: dict, guild: Guild) -> BaseEvent:
         """
@@ -509,6 +626,7 @@ class GuildEventLog:
             try:
                 await self.update_new_event(approved_event)
                 del self.approval_events[message_id]
+                self.event_index.pop(message_id, None)
             except (HTTPException, Forbidden) as e:
                 raise OpheliaCommandError(
                     "events_approval_error",
@@ -555,6 +673,7 @@ class GuildEventLog:
 
             try:
                 del self.approval_events[message_id]
+                self.event_index.pop(message_id, None)
 
                 # Edit approval message
                 rejected_message: Message = (
@@ -629,6 +748,7 @@ class GuildEventLog:
 
             target_event = self.upcoming_events[target_id]
             target_event.merge_edit(approved_edit)
+            self.schedule_check(target_event)
 
             try:
                 # Edit approval message
@@ -796,6 +916,9 @@ class GuildEventLog:
                 await self.calendar_channel.delete_messages(item_message)
 
             # Empty the list and fill the new one
+            for message_id in item_dict:
+                self.event_index.pop(message_id, None)
+
             item_dict.clear()
             for item in items:
                 await sender(item)
@@ -894,6 +1017,7 @@ class GuildEventLog:
             # By deleting the event message, the event would have
             # been deleted, but we delete it here just to be sure.
             self.upcoming_events.pop(message_id, None)
+            self.event_index.pop(message_id, None)
 
     async def end_ongoing_event(self, message_id: int) -> None:
         """
@@ -905,6 +1029,7 @@ class GuildEventLog:
             return
 
         del self.ongoing_events[message_id]
+        self.event_index.pop(message_id, None)
 
         try:
             message = await self.calendar_channel.fetch_message(message_id)
@@ -977,6 +1102,10 @@ class GuildEventLog:
                     )
 
                     self.ongoing_events[ongoing_message.id] = ongoing_event
+                    self.event_index[ongoing_message.id] = (
+                        ONGOING_BUCKET,
+                        ongoing_event
+                    )
 
     async def check_start(self) -> None:
         """
@@ -119,59 +119,35 @@ for item in ["new_title", "new_desc", "new_image"]:
     ))
 
 
-async def add_event_time_params(
-        copy_from: List[ConfigItem]
-) -> List[ConfigItem]:
-    """
-    Get a list of event add config items.
-
-    The reason why this is done separately is because everytime
-    someone submits a new event, we have to readjust the minimum
-    time.
-
-    :param copy_from: Base config items to copy from
-    :return: List of config items for adding a member event
-    """
-    add_items = copy.copy(copy_from)
-
-    add_items += [
-        ConfigItem(
-            "start_time",
-            disp_str("events_add_event_start_time"),
-            time_bounded_intify
-        ),
-        ConfigItem(
-            "notif_min_before",
-            disp_str("events_add_event_notif_min_before"),
-            bounded_intify(
-                minimum=0,
-                maximum=NOTIFY_MAX_MINUTES
-            )
-        )
-    ]
-
-    return add_items
-
-
-async def add_edit_time_params(
-        copy_from: List[ConfigItem]
-) -> List[ConfigItem]:
-    """
-    Get a list of event edit config items.
+# Time bounded config items
+#
+# The time bounded converters check against the current time whenever
+# they are called, so these lists can be built once and reused for
+# every event submission.
 
-    All we're doing here is adding the final config item with an
-    updated minimum time.
-
-    :param copy_from: Base config items to copy from
-    :return: List of config items for submitting an event edit
-    """
-    edit_items = copy.copy(copy_from)
-    edit_items.append(
-        ConfigItem(
-            "new_start_time",
-            disp_str("events_add_edit_new_start_time"),
-            optional_time_bounded_intify
+EVENT_TIME_CONFIG_ITEMS = [
+    ConfigItem(
+        "start_time",
+        disp_str("events_add_event_start_time"),
+        time_bounded_intify
+    ),
+    ConfigItem(
+        "notif_min_before",
+        disp_str("events_add_event_notif_min_before"),
+        bounded_intify(
+            minimum=0,
+            maximum=NOTIFY_MAX_MINUTES
         )
     )
+]
+
+ADD_CONFIG_ITEMS = BASE_ADD_CONFIG_ITEMS + EVENT_TIME_CONFIG_ITEMS
+RECURRING_CONFIG_ITEMS = BASE_RECURRING_CONFIG_ITEMS + EVENT_TIME_CONFIG_ITEMS
 
-    return edit_items
+EDIT_CONFIG_ITEMS = BASE_EDIT_CONFIG_ITEMS + [
+    ConfigItem(
+        "new_start_time",
+        disp_str("events_add_edit_new_start_time"),
+        optional_time_bounded_intify
+    )
+]
@@ -1,5 +1,10 @@
 """Events Cog Module."""
+import asyncio
 import functools
+import json
+import operator
+import os
+import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import yaml
@@ -20,8 +25,8 @@ from ophelia.events.calendar.member_event import MemberEvent
 from ophelia.events.calendar.ongoing_event import OngoingEvent
 from ophelia.events.calendar.recurring_event import RecurringEvent
 from ophelia.events.config_options import (
-    add_edit_time_params, add_event_time_params, BASE_ADD_CONFIG_ITEMS,
-    BASE_EDIT_CONFIG_ITEMS, BASE_RECURRING_CONFIG_ITEMS, SETUP_CONFIG_ITEMS
+    ADD_CONFIG_ITEMS, EDIT_CONFIG_ITEMS, RECURRING_CONFIG_ITEMS,
+    SETUP_CONFIG_ITEMS
 )
 from ophelia.events.events_emotes import (
     APPROVE_EMOTE, END_EVENT_EMOTE, NOTIF_EMOTE, REJECT_EMOTE
@@ -34,7 +39,7 @@ from ophelia.output.output import (
 )
 from ophelia.utils.discord_utils import (
     FETCH_FAIL_EXCEPTIONS,
-    filter_self_react
+    filter_self_react, resolve_member
 )
 
 CONFIG_TIMEOUT_SECONDS = settings.long_timeout
@@ -42,6 +47,173 @@ CONFIG_MAX_TRIES = settings.max_tries
 CHECK_INTERVAL_MINUTES = settings.events_check_interval_minutes
 SAVE_INTERVAL_MINUTES = settings.config_save_interval_minutes
 
+# Members that could not be fetched are not fetched again for a while
+MISSING_MEMBER_TTL_SECONDS = 60
+MISSING_MEMBER_CACHE_SIZE = 4096
+
+# JSON load cache of the events database; the YAML file stays the
+# source of truth and the cache is only used while it matches it
+EVENTS_DB_CACHE = os.path.splitext(settings.file_events_db)[0] + ".json"
+
+EVENT_TITLE = operator.attrgetter("title")
+ONGOING_EVENT_TITLE = operator.attrgetter("message_embed.title")
+
+
+def guild_context_check(func: Callable) -> Callable:
+    """
+    Decorator for checking if guild has been set up from command
+    context.
+
+    :param func: Async function to be wrapped
+    :return: Wrapped function
+    """
+
+    @functools.wraps(func)
+    async def wrapped(
+            self: "EventsCog",
+            context: Context,
+            *args,
+            **kwargs
+    ) -> None:
+        """
+        Inner function.
+
+        :param self: EventsCog instance
+        :param context: Command context
+        :param args: Arguments
+        :param kwargs: Keyword arguments
+        """
+        if self.get_event_log(context.guild.id) is None:
+            raise OpheliaCommandError("events_no_guild")
+
+        return await func(self, context, *args, **kwargs)
+
+    return wrapped
+
+
+def pass_user_events(func: Callable) -> Callable:
+    """
+    Decorator to pass the list of events initiated by the user
+    directly to the command.
+
+    :param func: Async function to be wrapped
+    :return: Wrapped function
+    """
+
+    @functools.wraps(func)
+    async def wrapped(
+            self: "EventsCog",
+            context: Context,
+            *args,
+            **kwargs
+    ) -> None:
+        """
+        Inner function.
+
+        :param self: EventsCog instance
+        :param context: Command context
+        """
+        event_log = self.get_event_log(context.guild.id)
+        event_dict = await event_log.retrieve_user_events(
+            context.author.id
+        )
+
+        if not event_dict:
+            raise OpheliaCommandError("events_no_events")
+
+        await func(
+            self,
+            context=context,
+            event_dict=event_dict,
+            *args,
+            **kwargs
+        )
+
+    return wrapped
+
+
+def guild_payload_check(func: Callable) -> Callable:
+    """
+    Decorator for checking if guild has been set up from discord
+    raw action payload.
+
+    :param func: Async function to be wrapped
+    :return: Wrapped function
+    """
+
+    @functools.wraps(func)
+    async def wrapped(
+            self: "EventsCog",
+            payload: Union[
+                RawReactionActionEvent,
+                RawMessageDeleteEvent,
+                RawBulkMessageDeleteEvent
+            ],
+            *args,
+            **kwargs
+    ) -> None:
+        """
+        Inner function.
+
+        :param self: EventsCog instance
+        :param payload: Raw discord action payload to extract
+            guild ID from
+        :param args: arguments
+        :param kwargs: Keyword arguments
+        """
+        if self.get_event_log(payload.guild_id) is None:
+            return
+
+        return await func(self, payload, *args, **kwargs)
+
+    return wrapped
+
+
+def guild_staff_check(func: Callable) -> Callable:
+    """
+    Decorator for checking if command caller has the staff role.
+
+    Since this decorator also checks if the guild has been set
+    up yet, commands that use this decorator can skip the
+    context check decorator.
+
+    :param func: Async function to be wrapped
+    :return: Wrapped function
+    """
+
+    @functools.wraps(func)
+    async def wrapped(
+            self: "EventsCog",
+            context: Context,
+            *args,
+            **kwargs
+    ) -> None:
+        """
+        Inner function.
+
+        :param self: EventsCog instance
+        :param context: Command context
+        :param args: arguments
+        :param kwargs: Keyword arguments
+        """
+        guild_event_log = self.get_event_log(context.guild.id)
+        if guild_event_log is None:
+            return
+
+        # We can assume that the author is a member since the
+        # command group is guild only.
+        author: Member = context.author
+        staff_role: Role = guild_event_log.staff_role
+
+        # Member.roles includes the default role, unlike get_role
+        staff_role_id = staff_role.id
+        if not any(role.id == staff_role_id for role in author.roles):
+            raise OpheliaCommandError("events_not_staff")
+
+        return await func(self, context, *args, **kwargs)
+
+    return wrapped
+
 
 class EventsCog(commands.Cog, name="events"):
     """
@@ -54,7 +226,14 @@ class EventsCog(commands.Cog, name="events"):
     server.
     """
 
-    __slots__ = ["guild_event_logs", "bot", "events_db"]
+    __slots__ = [
+        "guild_event_logs",
+        "bot",
+        "events_db",
+        "database_lock",
+        "missing_members",
+        "reaction_add_handlers"
+    ]
 
     # Using forward references to avoid cyclic imports
     # noinspection PyUnresolvedReferences
@@ -67,14 +246,86 @@ class EventsCog(commands.Cog, name="events"):
         self.bot = bot
         self.guild_event_logs: Dict[str, Any] = {}
         self.events_db: dict = {}
+        self.database_lock = asyncio.Lock()
+
+        # Time at which each (guild ID, member ID) failed to fetch
+        self.missing_members: Dict[Tuple[int, int], float] = {}
+
+        # Reaction add handlers indexed by emote
+        self.reaction_add_handlers: Dict[str, Callable] = {
+            APPROVE_EMOTE: self.reaction_approve,
+            REJECT_EMOTE: self.reaction_reject,
+            NOTIF_EMOTE: self.reaction_subscribe,
+            END_EVENT_EMOTE: self.reaction_end_event
+        }
 
         self.save_database.start()  # pylint: disable=no-member
         self.check_update.start()  # pylint: disable=no-member
 
+    def get_event_log(self, guild_id: Optional[int]) -> Optional[GuildEventLog]:
+        """
+        Get the event log of a guild.
+
+        :param guild_id: Discord Guild ID
+        :return: Guild event log, or None if the guild has not been set
+            up
+        """
+        if guild_id is None:
+            return None
+
+        return self.guild_event_logs.get(str(guild_id))
+
+    async def get_member(
+            self,
+            guild: Optional[Guild],
+            member_id: int
+    ) -> Optional[Member]:
+        """
+        Get a guild member, remembering members that could not be
+        fetched so that repeated lookups don't hit the Discord API.
+
+        :param guild: Discord guild
+        :param member_id: Member ID
+        :return: Guild member, or None if the member could not be found
+        """
+        if guild is None:
+            return None
+
+        key = (guild.id, member_id)
+        failed_time = self.missing_members.get(key)
+        if failed_time is not None:
+            if time.monotonic() - failed_time < MISSING_MEMBER_TTL_SECONDS:
+                return None
+
+            del self.missing_members[key]
+
+        try:
+            return await resolve_member(guild, member_id)
+        except FETCH_FAIL_EXCEPTIONS:
+            if len(self.missing_members) >= MISSING_MEMBER_CACHE_SIZE:
+                # Evict the oldest entry
+                del self.missing_members[next(iter(self.missing_members))]
+
+            self.missing_members[key] = time.monotonic()
+            return None
+
     async def cog_save_all(self) -> None:
-        """Save all events and server config options to database."""
-        for guild_id_str in self.guild_event_logs:
-            await self.save_guild_to_database(guild_id_str)
+        """
+        Save all events and server config options to database.
+
+        The database file is only rewritten if at least one guild's
+        saved config differs from what was last written.
+        """
+        changed = False
+        guild_event_log: GuildEventLog
+        for guild_id_str, guild_event_log in self.guild_event_logs.items():
+            guild_saved_config = await guild_event_log.save_config()
+            if self.events_db.get(guild_id_str) != guild_saved_config:
+                self.events_db[guild_id_str] = guild_saved_config
+                changed = True
+
+        if changed:
+            await self.write_database()
 
     @staticmethod
     async def list_events(
@@ -99,179 +350,46 @@ class EventsCog(commands.Cog, name="events"):
 
         return str_list, options_dict
 
-    class EventDecorators:
-        """
-        Event decorators for checking relevant guild configs and staff
-        roles before each listener or command.
+    @staticmethod
+    def format_event_titles(
+            event_dict: Dict[int, Any],
+            title_getter: Callable
+    ) -> str:
         """
+        Get a quoted list of event IDs and titles.
 
-        @classmethod
-        def guild_context_check(cls, func: Callable) -> Callable:
-            """
-            Decorator for checking if guild has been set up from command
-            context.
-
-            :param func: Async function to be wrapped
-            :return: Wrapped function
-            """
-
-            @functools.wraps(func)
-            async def wrapped(
-                    self: "EventsCog",
-                    context: Context,
-                    *args,
-                    **kwargs
-            ) -> None:
-                """
-                Inner function.
-
-                :param self: EventsCog instance
-                :param context: Command context
-                :param args: Arguments
-                :param kwargs: Keyword arguments
-                """
-                if str(context.guild.id) not in self.guild_event_logs:
-                    raise OpheliaCommandError("events_no_guild")
-
-                return await func(self, context, *args, **kwargs)
-
-            return wrapped
-
-        @classmethod
-        def pass_user_events(cls, func: Callable) -> Callable:
-            """
-            Decorator to pass the list of events initiated by the user
-            directly to the command.
-
-            :param func: Async function to be wrapped
-            :return: Wrapped function
-            """
+        :param event_dict: Dictionary of events indexed by message ID
+        :param title_getter: Callable that retrieves the title of an
+            event
+        :return: String list of events, one per line
+        """
+        return "\n".join(
+            f"> {event_id}: {title_getter(event)}"
+            for event_id, event in event_dict.items()
+        )
 
-            @functools.wraps(func)
-            async def wrapped(
-                    self: "EventsCog",
-                    context: Context,
-                    *args,
-                    **kwargs
-            ) -> None:
-                """
-                Inner function.
-
-                :param self: EventsCog instance
-                :param context: Command context
-                """
-                event_log: GuildEventLog = self.guild_event_logs[
-                    str(context.guild.id)
-                ]
-                event_dict = await event_log.retrieve_user_events(
-                    context.author.id
-                )
+    async def load_from_database(self) -> None:
+        """
+        Load all events and server config options from database.
 
-                if not event_dict:
-                    raise OpheliaCommandError("events_no_events")
+        The JSON cache is used only if it was built from the current
+        YAML database; otherwise the YAML database is parsed and the
+        cache is rebuilt, so that manual edits, restores and copies of
+        the YAML file are always picked up.
+        """
+        events_db = self.read_database_cache()
+        if events_db is None:
+            with open(settings.file_events_db, "r", encoding="utf-8") as file:
+                events_db = yaml.safe_load(file)
 
-                await func(
-                    self,
-                    context=context,
-                    event_dict=event_dict,
-                    *args,
-                    **kwargs
+            try:
+                self.write_database_cache(events_db)
+            except (OSError, TypeError, ValueError):
+                logger.opt(exception=True).warning(
+                    "Failed to write events database cache"
                 )
 
-            return wrapped
-
-        @classmethod
-        def guild_payload_check(cls, func: Callable) -> Callable:
-            """
-            Decorator for checking if guild has been set up from discord
-            raw action payload.
-
-            :param func: Async function to be wrapped
-            :return: Wrapped function
-            """
-
-            @functools.wraps(func)
-            async def wrapped(
-                    self: "EventsCog",
-                    payload: Union[
-                        RawReactionActionEvent,
-                        RawMessageDeleteEvent,
-                        RawBulkMessageDeleteEvent
-                    ],
-                    *args,
-                    **kwargs
-            ) -> None:
-                """
-                Inner function.
-
-                :param self: EventsCog instance
-                :param payload: Raw discord action payload to extract
-                    guild ID from
-                :param args: arguments
-                :param kwargs: Keyword arguments
-                """
-                guild_id = payload.guild_id
-                if (
-                        guild_id is None
-                        or str(guild_id) not in self.guild_event_logs
-                ):
-                    return
-
-                return await func(self, payload, *args, **kwargs)
-
-            return wrapped
-
-        @classmethod
-        def guild_staff_check(cls, func: Callable) -> Callable:
-            """
-            Decorator for checking if command caller has the staff role.
-
-            Since this decorator also checks if the guild has been set
-            up yet, commands that use this decorator can skip the
-            context check decorator.
-
-            :param func: Async function to be wrapped
-            :return: Wrapped function
-            """
-
-            @functools.wraps(func)
-            async def wrapped(
-                    self: "EventsCog",
-                    context: Context,
-                    *args,
-                    **kwargs
-            ) -> None:
-                """
-                Inner function.
-
-                :param self: EventsCog instance
-                :param context: Command context
-                :param args: arguments
-                :param kwargs: Keyword arguments
-                """
-                guild_id = context.guild.id
-                if str(guild_id) not in self.guild_event_logs:
-                    return
-
-                # We can assume that the author is a member since the
-                # command group is guild only.
-                author: Member = context.author
-                guild_event_log: GuildEventLog = self.guild_event_logs[
-                    str(guild_id)
-                ]
-                staff_role: Role = guild_event_log.staff_role
-
-                if staff_role not in author.roles:
-                    raise OpheliaCommandError("events_not_staff")
-
-                return await func(self, context, *args, **kwargs)
-
-            return wrapped
-
-    async def load_from_database(self) -> None:
-        """Load all events and server config options from database."""
-        with open(settings.file_events_db, "r", encoding="utf-8") as file:
-            self.events_db = yaml.safe_load(file)
+        self.events_db = events_db
 
         for guild_id_str, config_dict in self.events_db.items():
             guild = self.bot.get_guild(int(guild_id_str))
@@ -299,15 +417,95 @@ class EventsCog(commands.Cog, name="events"):
         guild_event_log: GuildEventLog = self.guild_event_logs[guild_id_str]
         guild_saved_config = await guild_event_log.save_config()
         self.events_db[guild_id_str] = guild_saved_config
+        await self.write_database()
+
+    async def write_database(self) -> None:
+        """
+        Write the saved configs of all guilds to the database file.
 
-        with open(settings.file_events_db, "w", encoding="utf-8") as file:
+        The dump runs in a worker thread so that it does not block
+        the event loop. It works on a shallow copy of the database,
+        since guild configs are replaced rather than mutated when they
+        are saved.
+        """
+        async with self.database_lock:
+            events_db = dict(self.events_db)
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self.dump_database,
+                events_db
+            )
+
+    @staticmethod
+    def dump_database(events_db: dict) -> None:
+        """
+        Dump the events database to file.
+
+        The JSON cache is not refreshed here, so saves only pay for the
+        YAML dump; the changed YAML file no longer matches the cache,
+        which is rebuilt on the next load instead.
+
+        :param events_db: Dictionary of saved guild configs
+        """
+        temp_path = f"{settings.file_events_db}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
             yaml.dump(
-                self.events_db,
+                events_db,
                 file,
                 default_flow_style=False,
                 allow_unicode=True
             )
 
+        os.replace(temp_path, settings.file_events_db)
+
+    @staticmethod
+    def database_signature() -> List[int]:
+        """
+        Identify the current version of the YAML database file.
+
+        :return: Modification time in nanoseconds and size of the file
+        """
+        stat = os.stat(settings.file_events_db)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @staticmethod
+    def write_database_cache(events_db: dict) -> None:
+        """
+        Write the JSON cache of the events database, tagged with the
+        signature of the YAML database it matches.
+
+        :param events_db: Dictionary of saved guild configs
+        """
+        cache = {
+            "signature": EventsCog.database_signature(),
+            "events_db": events_db
+        }
+
+        temp_path = f"{EVENTS_DB_CACHE}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(cache, file, ensure_ascii=False)
+
+        os.replace(temp_path, EVENTS_DB_CACHE)
+
+    @staticmethod
+    def read_database_cache() -> Optional[dict]:
+        """
+        Read the JSON cache of the events database.
+
+        :return: Dictionary of saved guild configs, or None if there is
+            no usable cache for the current YAML database
+        """
+        try:
+            with open(EVENTS_DB_CACHE, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+
+            if cache["signature"] == EventsCog.database_signature():
+                return cache["events_db"]
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.debug("Events database cache unusable, reading YAML")
+
+        return None
+
     @tasks.loop(minutes=SAVE_INTERVAL_MINUTES)
     async def save_database(self) -> None:
         """Save backup to database."""
@@ -318,14 +516,18 @@ class EventsCog(commands.Cog, name="events"):
         """Check for event notification and timeout updates."""
         event_log: GuildEventLog
         for event_log in self.guild_event_logs.values():
+            if not event_log.checks_due():
+                continue
+
             await event_log.check_retrieve()
             await event_log.check_start()
             await event_log.check_notify()
             await event_log.check_update()
             await event_log.check_timeout()
+            event_log.refresh_check_time()
 
     @commands.Cog.listener()
-    @EventDecorators.guild_payload_check
+    @guild_payload_check
     @filter_self_react
     async def on_raw_reaction_add(
             self,
@@ -339,30 +541,78 @@ class EventsCog(commands.Cog, name="events"):
 
         :param reaction_payload: Raw reaction payload
         """
-        emote = reaction_payload.emoji.name
+        handler = self.reaction_add_handlers.get(reaction_payload.emoji.name)
+        if handler is None:
+            return
+
         guild_event_log = self.guild_event_logs[str(reaction_payload.guild_id)]
-        if emote == APPROVE_EMOTE:
-            await self.approve(guild_event_log, reaction_payload.message_id)
-        elif emote == REJECT_EMOTE:
-            await self.reject(guild_event_log, reaction_payload.message_id)
-        elif emote == NOTIF_EMOTE:
-            await self.subscribe_event(
-                guild_event_log,
-                reaction_payload.message_id,
-                reaction_payload.user_id,
-                reaction_payload.guild_id
-            )
-        elif emote == END_EVENT_EMOTE:
-            await self.end_ongoing_event(
-                guild_event_log,
-                reaction_payload.guild_id,
-                reaction_payload.message_id,
-                reaction_payload.user_id
-            )
+        await handler(guild_event_log, reaction_payload)
+
+    async def reaction_approve(
+            self,
+            guild_event_log: GuildEventLog,
+            reaction_payload: RawReactionActionEvent
+    ) -> None:
+        """
+        Reaction handler for approving events and edits.
+
+        :param guild_event_log: Guild event log
+        :param reaction_payload: Raw reaction payload
+        """
+        await self.approve(guild_event_log, reaction_payload.message_id)
+
+    async def reaction_reject(
+            self,
+            guild_event_log: GuildEventLog,
+            reaction_payload: RawReactionActionEvent
+    ) -> None:
+        """
+        Reaction handler for rejecting events and edits.
+
+        :param guild_event_log: Guild event log
+        :param reaction_payload: Raw reaction payload
+        """
+        await self.reject(guild_event_log, reaction_payload.message_id)
+
+    async def reaction_subscribe(
+            self,
+            guild_event_log: GuildEventLog,
+            reaction_payload: RawReactionActionEvent
+    ) -> None:
+        """
+        Reaction handler for subscribing to event notifications.
+
+        :param guild_event_log: Guild event log
+        :param reaction_payload: Raw reaction payload
+        """
+        await self.subscribe_event(
+            guild_event_log,
+            reaction_payload.message_id,
+            reaction_payload.user_id,
+            reaction_payload.guild_id,
+            member=reaction_payload.member
+        )
+
+    async def reaction_end_event(
+            self,
+            guild_event_log: GuildEventLog,
+            reaction_payload: RawReactionActionEvent
+    ) -> None:
+        """
+        Reaction handler for ending ongoing events.
+
+        :param guild_event_log: Guild event log
+        :param reaction_payload: Raw reaction payload
+        """
+        await self.end_ongoing_event(
+            guild_event_log,
+            reaction_payload.guild_id,
+            reaction_payload.message_id,
+            reaction_payload.user_id,
+            member=reaction_payload.member
+        )
 
     @commands.Cog.listener()
-    @EventDecorators.guild_payload_check
-    @filter_self_react
     async def on_raw_reaction_remove(
             self,
             reaction_payload: RawReactionActionEvent
@@ -370,25 +620,36 @@ class EventsCog(commands.Cog, name="events"):
         """
         Listener for removing reactions.
 
-        Used for event notification unsubscription reactions.
+        Used for event notification unsubscription reactions. The guild
+        and self-react checks are done inline after the emote check
+        since almost all reaction removals use other emotes.
 
         :param reaction_payload: Raw reaction payload
         """
-        emote = reaction_payload.emoji.name
-        if emote == NOTIF_EMOTE:
-            guild_event_log = self.guild_event_logs[
-                str(reaction_payload.guild_id)
-            ]
-            await self.subscribe_event(
-                guild_event_log,
-                reaction_payload.message_id,
-                reaction_payload.user_id,
-                reaction_payload.guild_id,
-                unsubscribe=True
-            )
+        if reaction_payload.emoji.name != NOTIF_EMOTE:
+            return
+
+        guild_id = reaction_payload.guild_id
+        if guild_id is None:
+            return
+
+        guild_event_log = self.guild_event_logs.get(str(guild_id))
+        if guild_event_log is None:
+            return
+
+        if reaction_payload.user_id == self.bot.user.id:
+            return
+
+        await self.subscribe_event(
+            guild_event_log,
+            reaction_payload.message_id,
+            reaction_payload.user_id,
+            guild_id,
+            unsubscribe=True
+        )
 
     @commands.Cog.listener()
-    @EventDecorators.guild_payload_check
+    @guild_payload_check
     async def on_raw_message_delete(
             self,
             raw_message_delete: RawMessageDeleteEvent
@@ -407,7 +668,7 @@ class EventsCog(commands.Cog, name="events"):
         )
 
     @commands.Cog.listener()
-    @EventDecorators.guild_payload_check
+    @guild_payload_check
     async def on_raw_bulk_message_delete(
             self,
             raw_bulk_message_delete: RawBulkMessageDeleteEvent
@@ -420,11 +681,18 @@ class EventsCog(commands.Cog, name="events"):
 
         :param raw_bulk_message_delete: Raw bulk deletion event
         """
-        for event_id in raw_bulk_message_delete.message_ids:
-            await self.delete_event(
-                raw_bulk_message_delete.guild_id,
-                event_id
-            )
+        guild_id = raw_bulk_message_delete.guild_id
+        event_log: GuildEventLog = self.guild_event_logs[str(guild_id)]
+
+        # Most bulk deletions don't touch any events at all
+        event_ids = (
+                event_log.event_index.keys()
+                & raw_bulk_message_delete.message_ids
+        )
+
+        await asyncio.gather(*(
+            self.delete_event(guild_id, event_id) for event_id in event_ids
+        ))
 
     @commands.group("event", invoke_without_command=True)
     @commands.bot_has_guild_permissions(send_messages=True, embed_links=True)
@@ -488,31 +756,23 @@ class EventsCog(commands.Cog, name="events"):
         :param context: Command context
         :param config_vars: Configuration variables
         """
-        approval_events, upcoming_events, ongoing_events, approval_edits = (
-            {}, {}, {}, {}
-        )
-
         # Check if the server already has events
-        guild_id = context.guild.id
-        old_log: Optional[GuildEventLog] = None
-        if str(guild_id) in self.guild_event_logs:
-            old_log = self.guild_event_logs[str(guild_id)]
-            approval_events = old_log.approval_events
-            upcoming_events = old_log.upcoming_events
-            ongoing_events = old_log.ongoing_events
-            approval_edits = old_log.approval_edits
-
-        config_vars.update({
-            "approval_events": approval_events,
-            "upcoming_events": upcoming_events,
-            "ongoing_events": ongoing_events,
-            "approval_edits": approval_edits
-        })
+        guild_id_str = str(context.guild.id)
+        old_log = self.guild_event_logs.get(guild_id_str)
+        if old_log is not None:
+            config_vars.update(old_log.event_dicts())
+        else:
+            config_vars.update({
+                "approval_events": {},
+                "upcoming_events": {},
+                "ongoing_events": {},
+                "approval_edits": {}
+            })
 
         # Initialize new event log with event and edit lists
         try:
             new_log = await GuildEventLog.new_guild_log(config_vars)
-            self.guild_event_logs[str(guild_id)] = new_log
+            self.guild_event_logs[guild_id_str] = new_log
 
             if old_log is not None:
                 await new_log.force_update_calendar(
@@ -530,13 +790,13 @@ class EventsCog(commands.Cog, name="events"):
                 colour=Colour(settings.embed_color_success)
             )
 
-            await self.save_guild_to_database(str(guild_id))
+            await self.save_guild_to_database(guild_id_str)
 
         except GuildEventInvalidConfig as e:
             raise OpheliaCommandError("events_guild_event_invalid") from e
 
     @event.command(name="add", aliases=["a", "submit"])
-    @EventDecorators.guild_context_check
+    @guild_context_check
     async def event_add(self, context: Context) -> None:
         """
         Submit member event for staff approval.
@@ -553,7 +813,7 @@ class EventsCog(commands.Cog, name="events"):
             bot=self.bot,
             context=context,
             message=message,
-            config_items=await add_event_time_params(BASE_ADD_CONFIG_ITEMS),
+            config_items=ADD_CONFIG_ITEMS,
             response_call=await self.gen_confirm_add(MemberEvent.config_name()),
             timeout_seconds=CONFIG_TIMEOUT_SECONDS,
             response_tries=CONFIG_MAX_TRIES,
@@ -561,7 +821,7 @@ class EventsCog(commands.Cog, name="events"):
         )
 
     @event.command(name="addr", aliases=["ar"])
-    @EventDecorators.guild_staff_check
+    @guild_staff_check
     async def event_add_recurring(self, context: Context) -> None:
         """
         Submit recurring event for staff approval.
@@ -582,9 +842,7 @@ class EventsCog(commands.Cog, name="events"):
             bot=self.bot,
             context=context,
             message=message,
-            config_items=await add_event_time_params(
-                BASE_RECURRING_CONFIG_ITEMS
-            ),
+            config_items=RECURRING_CONFIG_ITEMS,
             response_call=await self.gen_confirm_add(
                 RecurringEvent.config_name()
             ),
@@ -622,8 +880,8 @@ class EventsCog(commands.Cog, name="events"):
         return func
 
     @event.command(name="edit", aliases=["e"])
-    @EventDecorators.guild_context_check
-    @EventDecorators.pass_user_events
+    @guild_context_check
+    @pass_user_events
     async def event_edit(self, context: Context, *_, **kwargs) -> None:
         """
         Submit event edit for staff approval.
@@ -672,9 +930,7 @@ class EventsCog(commands.Cog, name="events"):
             bot=self.bot,
             context=context,
             message=message,
-            config_items=await add_edit_time_params(
-                BASE_EDIT_CONFIG_ITEMS
-            ),
+            config_items=EDIT_CONFIG_ITEMS,
             response_call=await self.gen_confirm_edit(event_id),
             timeout_seconds=CONFIG_TIMEOUT_SECONDS,
             response_tries=CONFIG_MAX_TRIES,
@@ -712,8 +968,8 @@ class EventsCog(commands.Cog, name="events"):
         return func
 
     @event.command(name="delete", aliases=["d"])
-    @EventDecorators.guild_context_check
-    @EventDecorators.pass_user_events
+    @guild_context_check
+    @pass_user_events
     async def event_delete(self, context: Context, *_, **kwargs) -> None:
         """
         Delete upcoming event.
@@ -760,7 +1016,7 @@ class EventsCog(commands.Cog, name="events"):
         )
 
     @event.command(name="listall", aliases=["la"])
-    @EventDecorators.guild_staff_check
+    @guild_staff_check
     async def event_listall(self, context: Context) -> None:
         """
         Lists all background events in the current server.
@@ -768,29 +1024,27 @@ class EventsCog(commands.Cog, name="events"):
         :param context: Command context
         """
         event_log: GuildEventLog = self.guild_event_logs[str(context.guild.id)]
-        approval_list = "\n".join(
-            f"> {k}: {v.title}" for k, v in event_log.approval_events.items()
-        )
-        upcoming_list = "\n".join(
-            f"> {k}: {v.title}" for k, v in event_log.upcoming_events.items()
-        )
-        ongoing_list = "\n".join(
-            f"> {k}: {v.message_embed.title}"
-            for k, v in event_log.ongoing_events.items()
-        )
-
         await send_message_embed(
             channel=context,
             title=disp_str("events_listall_title"),
             desc=disp_str("events_listall_desc").format(
-                approval_list,
-                upcoming_list,
-                ongoing_list
+                self.format_event_titles(
+                    event_log.approval_events,
+                    EVENT_TITLE
+                ),
+                self.format_event_titles(
+                    event_log.upcoming_events,
+                    EVENT_TITLE
+                ),
+                self.format_event_titles(
+                    event_log.ongoing_events,
+                    ONGOING_EVENT_TITLE
+                )
             )
         )
 
     @event.command(name="forcedelete", aliases=["forcedel", "fd"])
-    @EventDecorators.guild_staff_check
+    @guild_staff_check
     async def event_force_delete(
             self,
             context: Context,
@@ -823,13 +1077,10 @@ class EventsCog(commands.Cog, name="events"):
         :param event_id: Event ID
         """
         event_log: GuildEventLog = self.guild_event_logs[str(guild_id)]
-
-        await event_log.reject_event(event_id)
-        await event_log.delete_upcoming_event(event_id)
-        await event_log.end_ongoing_event(event_id)
+        await event_log.remove_event(event_id)
 
     @event.command(name="save", aliases=["s"])
-    @EventDecorators.guild_staff_check
+    @guild_staff_check
     async def event_save(self, context: Context) -> None:
         """
         Saves current event configuration to file.
@@ -875,7 +1126,8 @@ class EventsCog(commands.Cog, name="events"):
             message_id: int,
             member_id: int,
             guild_id: int,
-            unsubscribe: bool = False
+            unsubscribe: bool = False,
+            member: Optional[Member] = None
     ) -> None:
         """
         Subscribe to an upcoming event.
@@ -885,13 +1137,18 @@ class EventsCog(commands.Cog, name="events"):
         :param member_id: ID of member subscribing
         :param guild_id: ID of Discord Guild
         :param unsubscribe: Whether the member is unsubscribing
+        :param member: Member subscribing, if already known
         """
-        guild: Guild = self.bot.get_guild(guild_id)
-        try:
-            member: Member = await guild.fetch_member(member_id)
-        except FETCH_FAIL_EXCEPTIONS:
+        # Don't look the member up for reactions on other messages
+        if message_id not in guild_event_log.upcoming_events:
             return
 
+        if member is None:
+            guild: Guild = self.bot.get_guild(guild_id)
+            member = await self.get_member(guild, member_id)
+            if member is None:
+                return
+
         await guild_event_log.subscribe_event(
             message_id=message_id,
             member=member,
@@ -903,7 +1160,8 @@ class EventsCog(commands.Cog, name="events"):
             guild_event_log: GuildEventLog,
             guild_id: int,
             message_id: int,
-            member_id: int
+            member_id: int,
+            member: Optional[Member] = None
     ) -> None:
         """
         End an ongoing event.
@@ -912,8 +1170,8 @@ class EventsCog(commands.Cog, name="events"):
         :param guild_id: Discord Guild ID
         :param message_id: Message ID of event to end
         :param member_id: Member ID of member who tried to end it
+        :param member: Member who tried to end it, if already known
         """
-        guild: Guild = self.bot.get_guild(guild_id)
         try:
             ongoing_event: OngoingEvent = guild_event_log.ongoing_events[
                 message_id
@@ -925,12 +1183,14 @@ class EventsCog(commands.Cog, name="events"):
         if member_id == ongoing_event.organizer_id:
             delete_event = True
         else:
-            try:
-                member: Member = await guild.fetch_member(member_id)
-            except FETCH_FAIL_EXCEPTIONS:
-                return
+            if member is None:
+                guild: Guild = self.bot.get_guild(guild_id)
+                member = await self.get_member(guild, member_id)
+                if member is None:
+                    return
 
-            if guild_event_log.staff_role in member.roles:
+            staff_role_id = guild_event_log.staff_role.id
+            if any(role.id == staff_role_id for role in member.roles):
                 delete_event = True
 
         if delete_event:
@@ -29,9 +29,13 @@ error_forbidden = "I was forbidden to execute the command."
 # Command invocation exceptions
 command_error_user_input_error = "User input error."
 command_error_conversion_error = "Failed to convert argument."
-command_error_bad_arugment = "Invalid argument."
-command_error_bad_union_argument = "Invalid argument."
-command_error_missing_required_arugment = "Missing required argument."
+command_error_bad_argument = "Invalid argument."
+command_error_bad_union_argument = command_error_bad_argument
+command_error_missing_required_argument = "Missing required argument."
+
+# Old misspelled names
+command_error_bad_arugment = command_error_bad_argument
+command_error_missing_required_arugment = command_error_missing_required_argument
 command_error_unexpected_quote_error = "Encountered unexpected quote mark inside non-quoted string."
 command_error_invalid_end_of_quoted_string_error = "Invalid end of quoted string."
 command_error_expected_closing_quote_error = "Did not find closing quote character."
@@ -124,8 +128,8 @@ reactrole_cmd_view_yaml_desc = "Raw YAML format:```\n{}\n```"
 
 reactrole_cmd_delete_invalid_message_title = "Delete invalid message reaction roles"
 reactrole_cmd_delete_invalid_message_desc = "I cannot reach this message ({}) with {} reaction{}, but it has been recorded in the reaction roles config. Should I delete it?\n\n**Y** | Yes\n**N** | No"
-reactrole_cmd_delete_invalid_confirm_title = "Deleted message reaction roles"
-reactrole_cmd_delete_invalid_confirm_desc = "Successfully deleted all reaction role configuration parameters for given message."
+reactrole_cmd_delete_invalid_confirm_title = reactrole_cmd_delete_confirm_title
+reactrole_cmd_delete_invalid_confirm_desc = reactrole_cmd_delete_confirm_desc
 
 """'''
 Events
@@ -133,10 +137,7 @@ Events
 
 events_embed_text = "{}\n\n**Time:**\n%TIME%"
 events_recurring_embed_text = "{}\n\n**Event Repeats**:\nEvery {} days\n\n**Time:**\n%TIME%"
-events_embed_ongoing = "{}"
 events_time_footer = "Your timezone"
-events_ongoing_message = "{}"
-events_dm_notif = "{}"
 events_delete = "Upcoming event deleted (This will also occur when an event starts):"
 events_approval = "Event from {} awaiting approval.\n\n**Description:**\n{}\n\n**DM Notification Message:**\n{}\n\n**Notification Time** (Minutes before event start):\n{}"
 events_recurring_approval = "Recurring event from {} awaiting approval.\n\nNote that recurring events were not designed to be used by non-staff.\n\n**Description:**\n{}\n\n**Queue Channel:**\n{}\n\n**Target Channel:**\n{}\n\n**DM Notification Message:**\n{}\n\n**Notification Time** (Minutes before event start):\n{}\n\n**Repetition Interval (Days):**\n{}\n\n**Event Time:**"
@@ -303,7 +304,7 @@ voicerooms_update_cancel_title = "Action Cancelled."
 voicerooms_update_cancel_desc = "To update generator permissions, use the `%PREFIX%vc updategen` command."
 
 voicerooms_raw_header = "**{time}** in **#{channel}**\n{text}"
-voicerooms_log_header = "**{time}** in **#{channel}**\n**{name}:** ({id})"
+voicerooms_log_header = "**%s** in **#%s**\n**%s:** (%s)"
 voicerooms_log_tail = "{}\n_ _"
 voicerooms_log_attachments = "**Attachments: ** {}\n_ _"
 voicerooms_log_create_room = "**{name}** ({id}) **created new VC room**\n_ _"
@@ -6,46 +6,150 @@ function that is in __init__ since it isn't tied to the command error
 system though.
 """
 
+import functools
+from typing import Callable, Dict, Tuple
+
 from discord import Forbidden
 from discord.ext.commands import (
-    BotMissingAnyRole, BotMissingPermissions, BotMissingRole, CommandError,
-    CommandNotFound,
-    Context, MissingAnyRole, MissingPermissions, MissingRole
+    BadArgument, BadBoolArgument, BadUnionArgument, BotMissingAnyRole,
+    BotMissingPermissions, BotMissingRole, ChannelNotFound,
+    ChannelNotReadable, CommandError, CommandInvokeError, CommandNotFound,
+    CommandOnCooldown, Context, ConversionError, EmojiNotFound,
+    ExpectedClosingQuoteError, InvalidEndOfQuotedStringError,
+    MemberNotFound, MessageNotFound, MissingAnyRole, MissingPermissions,
+    MissingRequiredArgument, MissingRole, NoPrivateMessage,
+    NotOwner, NSFWChannelRequired, PartialEmojiConversionFailure,
+    PrivateMessageOnly, RoleNotFound, TooManyArguments,
+    UnexpectedQuoteError, UserInputError, UserNotFound
 )
 from loguru import logger
 
 from ophelia.output.output import disp_str, send_error_embed
 
 COMMAND_ERRORS = {
-    "UserInputError": "command_error_user_input_error",
-    "ConversionError": "command_error_conversion_error",
-    "BadArgument": "command_error_bad_argument",
-    "BadUnionArgument": "command_error_bad_argument",
-    "MissingRequiredArgument": "command_error_missing_required_arugment",
-    "UnexpectedQuoteError": "command_error_unexpected_quote_error",
-    "InvalidEndOfQuotedStringError": (
+    UserInputError: "command_error_user_input_error",
+    ConversionError: "command_error_conversion_error",
+    BadArgument: "command_error_bad_argument",
+    BadUnionArgument: "command_error_bad_argument",
+    MissingRequiredArgument: "command_error_missing_required_argument",
+    UnexpectedQuoteError: "command_error_unexpected_quote_error",
+    InvalidEndOfQuotedStringError: (
         "command_error_invalid_end_of_quoted_string_error"
     ),
-    "ExpectedClosingQuoteError": "command_error_expected_closing_quote_error",
-    "PrivateMessageOnly": "command_error_private_message_only",
-    "NoPrivateMessage": "command_error_no_private_message",
-    "CommandInvokeError": "command_error_invoke_error",
-    "TooManyArguments": "command_error_too_many_arguments",
-    "CommandOnCooldown": "command_error_command_on_cooldown",
-    "NotOwner": "command_error_not_owner",
-    "MessageNotFound": "command_error_message_not_found",
-    "MemberNotFound": "command_error_member_not_found",
-    "UserNotFound": "command_error_user_not_found",
-    "ChannelNotFound": "command_error_channel_not_found",
-    "ChannelNotReadable": "command_error_channel_not_readable",
-    "RoleNotFound": "command_error_role_not_found",
-    "EmojiNotFound": "command_error_emoji_not_found",
-    "PartialEmojiConversionFailure": (
+    ExpectedClosingQuoteError: "command_error_expected_closing_quote_error",
+    PrivateMessageOnly: "command_error_private_message_only",
+    NoPrivateMessage: "command_error_no_private_message",
+    CommandInvokeError: "command_error_invoke_error",
+    TooManyArguments: "command_error_too_many_arguments",
+    CommandOnCooldown: "command_error_command_on_cooldown",
+    NotOwner: "command_error_not_owner",
+    MessageNotFound: "command_error_message_not_found",
+    MemberNotFound: "command_error_member_not_found",
+    UserNotFound: "command_error_user_not_found",
+    ChannelNotFound: "command_error_channel_not_found",
+    ChannelNotReadable: "command_error_channel_not_readable",
+    RoleNotFound: "command_error_role_not_found",
+    EmojiNotFound: "command_error_emoji_not_found",
+    PartialEmojiConversionFailure: (
         "command_error_partial_emoji_conversion_failure"
     ),
-    "BadBoolArgument": "command_error_bad_bool_argument",
-    "NSFWChannelRequired": "command_error_nsfw_channel_required"
+    BadBoolArgument: "command_error_bad_bool_argument",
+    NSFWChannelRequired: "command_error_nsfw_channel_required"
+}
+
+# Display strings are fixed once loaded, so resolve them up front
+COMMAND_ERROR_MESSAGES = {
+    error_type: disp_str(str_name)
+    for error_type, str_name in COMMAND_ERRORS.items()
 }
+COMMAND_ERROR_HEADER = disp_str("command_error_header")
+COMMAND_ERROR_LOGGER_HEADER = disp_str("command_error_logger_header")
+COMMAND_ERROR_FAILED_TO_SEND = disp_str("command_error_failed_to_send")
+
+
+def list_formatter(
+        str_name: str,
+        attribute: str
+) -> Callable[[Exception], str]:
+    """
+    Creates a formatter for errors that list missing items.
+
+    :param str_name: Name of display string to format
+    :param attribute: Name of the exception attribute holding the list
+    :return: Formatter taking an exception and returning the message
+    """
+    template = disp_str(str_name)
+
+    def formatter(exception: Exception) -> str:
+        """
+        Formats the listed items of an exception into the template.
+
+        :param exception: Exception raised by command
+        :return: Formatted error message
+        """
+        return template.format(
+            ", ".join(map(str, getattr(exception, attribute)))
+        )
+
+    return formatter
+
+
+def item_formatter(
+        str_name: str,
+        attribute: str
+) -> Callable[[Exception], str]:
+    """
+    Creates a formatter for errors about a single missing item.
+
+    :param str_name: Name of display string to format
+    :param attribute: Name of the exception attribute holding the item
+    :return: Formatter taking an exception and returning the message
+    """
+    template = disp_str(str_name)
+
+    def formatter(exception: Exception) -> str:
+        """
+        Formats the item of an exception into the template.
+
+        :param exception: Exception raised by command
+        :return: Formatted error message
+        """
+        return template.format(getattr(exception, attribute))
+
+    return formatter
+
+
+COMMAND_ERROR_FORMATTERS: Dict[type, Callable[[Exception], str]] = {
+    MissingPermissions: list_formatter(
+        "command_error_missing_permissions", "missing_permissions"
+    ),
+    BotMissingPermissions: list_formatter(
+        "command_error_bot_missing_permissions", "missing_permissions"
+    ),
+    MissingRole: item_formatter(
+        "command_error_missing_role", "missing_role"
+    ),
+    BotMissingRole: item_formatter(
+        "command_error_bot_missing_role", "missing_role"
+    ),
+    MissingAnyRole: list_formatter(
+        "command_error_missing_any_roles", "missing_roles"
+    ),
+    BotMissingAnyRole: list_formatter(
+        "command_error_bot_missing_any_role", "missing_roles"
+    )
+}
+
+
+@functools.lru_cache(maxsize=256)
+def error_templates(disp_type: str) -> Tuple[str, str]:
+    """
+    Retrieves the title and description templates of an error.
+
+    :param disp_type: Display type taken from disp_str
+    :return: Tuple of title and description templates
+    """
+    return disp_str(f"{disp_type}_title"), disp_str(f"{disp_type}_desc")
 
 
 class OpheliaCommandError(CommandError):
@@ -63,8 +167,7 @@ class OpheliaCommandError(CommandError):
 
         :param disp_type: Display type taken from disp_str
         """
-        self.error_header = disp_str(f"{disp_type}_title")
-        self.error_message = disp_str(f"{disp_type}_desc")
+        self.error_header, self.error_message = error_templates(disp_type)
 
         if args:
             self.error_message = self.error_message.format(*args)
@@ -86,42 +189,20 @@ async def handle_command_error(
         logger.trace("Command not found: {}", context.command)
         return
 
-    error_header = disp_str("command_error_header")
-
-    try:
-        # This is ugly. I don't know why I'm doing this. I'm sorry.
-        error_message = (
-                disp_str(COMMAND_ERRORS[type(exception).__name__])
-                + "\n" + str(exception)
-        )
-    except KeyError:
-        if isinstance(exception, OpheliaCommandError):
-            error_header = exception.error_header
-            error_message = exception.error_message
-        elif isinstance(exception, MissingPermissions):
-            error_message = disp_str(
-                "command_error_missing_permissions"
-            ).format(", ".join(exception.missing_permissions))
-        elif isinstance(exception, BotMissingPermissions):
-            error_message = disp_str(
-                "command_error_bot_missing_permissions"
-            ).format(", ".join(exception.missing_permissions))
-        elif isinstance(exception, MissingRole):
-            error_message = disp_str(
-                "command_error_missing_role"
-            ).format(exception.missing_role)
-        elif isinstance(exception, BotMissingRole):
-            error_message = disp_str(
-                "command_error_bot_missing_role"
-            ).format(exception.missing_role)
-        elif isinstance(exception, MissingAnyRole):
-            error_message = disp_str(
-                "command_error_missing_any_role"
-            ).format(", ".join(role for role in exception.missing_roles))
-        elif isinstance(exception, BotMissingAnyRole):
-            error_message = disp_str(
-                "command_error_bot_missing_any_role"
-            ).format(", ".join(role for role in exception.missing_roles))
+    error_header = COMMAND_ERROR_HEADER
+    error_message = COMMAND_ERROR_MESSAGES.get(type(exception))
+
+    if error_message is not None:
+        error_message = f"{error_message}\n{exception}"
+    elif isinstance(exception, OpheliaCommandError):
+        error_header = exception.error_header
+        error_message = exception.error_message
+    else:
+        for error_type in type(exception).__mro__:
+            formatter = COMMAND_ERROR_FORMATTERS.get(error_type)
+            if formatter is not None:
+                error_message = formatter(exception)
+                break
         else:
             logger.error(
                 "Ignored command error {} "
@@ -136,7 +217,7 @@ async def handle_command_error(
         # Trace, because we don't need the bot to report to us whenever
         # a user enters a command wrongly.
         logger.trace(
-            disp_str("command_error_logger_header"),
+            COMMAND_ERROR_LOGGER_HEADER,
             error_message,
             context.command
         )
@@ -149,7 +230,7 @@ async def handle_command_error(
             )
         except Forbidden:
             logger.warning(
-                disp_str("command_error_failed_to_send"),
+                COMMAND_ERROR_FAILED_TO_SEND,
                 context.channel.id,
                 error_message
             )
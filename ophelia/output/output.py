@@ -8,15 +8,16 @@ messages and embeds, Discord error messages, as well as all the
 """
 
 import asyncio
+import functools
 import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import yaml
 from discord import Colour, Embed, Forbidden, HTTPException, Message
-from discord.abc import Messageable
+from discord.abc import GuildChannel, Messageable
 from discord.ext.commands import Context
 from loguru import logger
 
@@ -24,18 +25,58 @@ from ophelia import settings
 from ophelia.output import eng_strings
 from ophelia.utils.discord_utils import FETCH_FAIL_EXCEPTIONS
 from ophelia.utils.text_utils import group_strings
+from ophelia.utils.yaml_utils import YAML_LOADER
 
 PARENT_DIRECTORY = os.getcwd().split("ophelia")[0]
 DEFAULT_LANG = "eng"
 TOKEN_REGEX = r"[MN][A-Za-z\d]{23}\.[\w-]{6}\.[\w-]{27}"
+TOKEN_PATTERN = re.compile(TOKEN_REGEX)
+
+# Token and path guards combined, so that both can be applied in a
+# single pass over the message text
+GUARD_PATTERN = re.compile(f"({TOKEN_REGEX})|{re.escape(PARENT_DIRECTORY)}")
+
+MAX_YAML_INPUT_LENGTH = 16384
+
+# YAML inputs longer than this are parsed in a worker thread
+YAML_EXECUTOR_THRESHOLD = 2048
+
+
+class CurrentTime:
+    """Sentinel type for embeds timestamped with the time of sending."""
+
+    __slots__ = []
+
+
+# Default embed timestamp, resolved to the time at which the embed is
+# sent; None is used to send embeds without timestamps.
+CURRENT_TIME = CurrentTime()
+
 
 # Turned into a dict at runtime, so that we don't have to use getattr.
+# The command prefix doesn't change while the bot is running, so it is
+# substituted into every string here once.
 ENG_STRINGS = {
-    name: value for name, value in vars(eng_strings).items()
+    name: value.replace("%PREFIX%", settings.command_prefix)
+    for name, value in vars(eng_strings).items()
     if not name.startswith("__")
 }
 
 
+def guard_replacement(match: re.Match) -> str:
+    """
+    Get the replacement for a token or project path matched by
+    GUARD_PATTERN.
+
+    :param match: Regex match
+    :return: Replacement string
+    """
+    if match.group(1):
+        return "[REDACTED TOKEN]"
+
+    return "../"
+
+
 def disp_str(str_name: str, lang: str = DEFAULT_LANG) -> str:
     """
     Retrieves display string based on string name.
@@ -44,10 +85,8 @@ def disp_str(str_name: str, lang: str = DEFAULT_LANG) -> str:
     :param lang: Language of string
     :return: Pre-formatted string
     """
-    if lang == "eng" and str_name in ENG_STRINGS:
-        return ENG_STRINGS[str_name].replace(
-            "%PREFIX%", settings.command_prefix
-        )
+    if lang == "eng":
+        return ENG_STRINGS.get(str_name, "")
 
     return ""
 
@@ -71,10 +110,11 @@ async def send_message(
     :param mass_ping_guard: Prevent mass pings (@everyone and @here)
     :return: Discord Message object
     """
-    if token_guard:
-        text = re.sub(TOKEN_REGEX, "[REDACTED TOKEN]", text)
-
-    if path_guard:
+    if token_guard and path_guard:
+        text = GUARD_PATTERN.sub(guard_replacement, text)
+    elif token_guard:
+        text = TOKEN_PATTERN.sub("[REDACTED TOKEN]", text)
+    elif path_guard:
         text = text.replace(PARENT_DIRECTORY, "../")
 
     if mass_ping_guard:
@@ -107,6 +147,64 @@ async def send_message(
                 )
 
 
+def can_embed(channel: Messageable) -> bool:
+    """
+    Check if the bot has the embed links permission in a channel.
+
+    This is computed locally from the cached guild state, and is always
+    true for channels that aren't guild channels, such as DMs.
+
+    :param channel: Context or channel to check
+    :return: Whether the bot can send embeds in the channel
+    """
+    if isinstance(channel, Context):
+        channel = channel.channel
+
+    if not isinstance(channel, GuildChannel):
+        return True
+
+    return channel.permissions_for(channel.guild.me).embed_links
+
+
+async def send_embed_fallback(
+        channel: Messageable,
+        embed_text: str,
+        title: str = "",
+        footer_text: Optional[str] = None,
+        fields: Optional[List[Tuple[str, str, bool]]] = None
+) -> Optional[Message]:
+    """
+    Sends the contents of an embed as a regular message.
+
+    :param channel: Context or channel of message
+    :param embed_text: Text content of embed
+    :param title: Title of embed
+    :param footer_text: Footer text of embed
+    :param fields: List of fields represented by a tuple of their title,
+        text, and inline mode
+    :return: Discord Message object
+    """
+    field_text = ""
+    if fields is not None and len(fields) > 0:
+        field_text = "\n\n".join(
+            f"**{field_title}**\n{text}" for field_title, text, _ in fields
+        )
+
+    try:
+        message = await send_message(
+            channel,
+            f"**{title}**\n\n{embed_text}\n\n"
+            f"{field_text}\n\n{footer_text}"
+        )
+
+        return message
+    except Forbidden:
+        logger.trace(
+            "Failed to send message to channel ID {}",
+            str(channel)
+        )
+
+
 async def send_embed(
         channel: Messageable,
         embed_text: str,
@@ -115,7 +213,7 @@ async def send_embed(
         colour: Colour = Colour(settings.embed_color_normal),
         footer_text: Optional[str] = None,
         footer_icon: Optional[str] = None,
-        timestamp: Optional[datetime] = datetime.now(),
+        timestamp: Union[datetime, None, CurrentTime] = CURRENT_TIME,
         fields: Optional[List[Tuple[str, str, bool]]] = None,
         embed_fallback: bool = False,
         token_guard: bool = False,
@@ -131,7 +229,7 @@ async def send_embed(
     :param colour: Colour of embed
     :param footer_text: Footer text of embed
     :param footer_icon: Footer icon URL of embed
-    :param timestamp: Timestamp of embed
+    :param timestamp: Timestamp of embed, defaults to the current time
     :param fields: List of fields represented by a tuple of their title,
         text, and inline mode
     :param embed_fallback: Whether embed will be sent as a regular
@@ -141,13 +239,26 @@ async def send_embed(
     :return: Discord Message object
     """
     if token_guard:
-        title = re.sub(TOKEN_REGEX, "[REDACTED TOKEN]", title)
-        embed_text = re.sub(TOKEN_REGEX, "[REDACTED TOKEN]", embed_text)
+        title = TOKEN_PATTERN.sub("[REDACTED TOKEN]", title)
+        embed_text = TOKEN_PATTERN.sub("[REDACTED TOKEN]", embed_text)
 
     if path_guard:
         title = title.replace(PARENT_DIRECTORY, ".")
         embed_text = embed_text.replace(PARENT_DIRECTORY, ".")
 
+    # Skip the embed attempt if we already know it's going to fail
+    if embed_fallback and not can_embed(channel):
+        return await send_embed_fallback(
+            channel,
+            embed_text,
+            title,
+            footer_text,
+            fields
+        )
+
+    if timestamp is CURRENT_TIME:
+        timestamp = datetime.now()
+
     embed = Embed(
         title=title,
         url=url if url is not None else Embed.Empty,
@@ -164,8 +275,9 @@ async def send_embed(
 
     try:
         if fields is not None:
+            add_field = embed.add_field
             for name, text, inline in fields:
-                embed = embed.add_field(name=name, value=text, inline=inline)
+                add_field(name=name, value=text, inline=inline)
     except ValueError:
         logger.warning("Failed to add fields to embed: {}", str(fields))
 
@@ -182,25 +294,13 @@ async def send_embed(
         )
 
         if embed_fallback:
-            field_text = ""
-            if fields is not None and len(fields) > 0:
-                field_text = "\n\n".join(
-                    f"**{title}**\n{text}" for title, text, inline in fields
-                )
-
-            try:
-                message = await send_message(
-                    channel,
-                    f"**{title}**\n\n{embed_text}\n\n"
-                    f"{field_text}\n\n{footer_text}"
-                )
-
-                return message
-            except Forbidden:
-                logger.trace(
-                    "Failed to send message to channel ID {}",
-                    str(channel)
-                )
+            return await send_embed_fallback(
+                channel,
+                embed_text,
+                title,
+                footer_text,
+                fields
+            )
 
 
 async def send_message_embed(
@@ -299,6 +399,39 @@ async def send_error_embed(
     )
 
 
+async def edit_error_embed(
+        message: Optional[Message],
+        channel: Messageable,
+        title: str,
+        desc: str
+) -> Message:
+    """
+    Edit a bot message into an error embed, sending a new error embed
+    instead if the message could not be edited.
+
+    :param message: Bot message to edit
+    :param channel: Channel to send error to if the edit fails
+    :param title: Embed title
+    :param desc: Embed desc
+    :return: Edited or sent message
+    """
+    if message is not None:
+        try:
+            await message.edit(
+                content=None,
+                embed=Embed(
+                    title=title,
+                    description=desc,
+                    colour=Colour(settings.embed_color_severe)
+                )
+            )
+            return message
+        except FETCH_FAIL_EXCEPTIONS:
+            pass
+
+    return await send_error_embed(channel, title, desc)
+
+
 async def try_del(
         delete_message: bool,
         delete_response: bool,
@@ -341,17 +474,72 @@ async def get_input(
     :param check: Message content validity check
     :return: User input message
     """
+    # Every message the bot receives goes through the check, so compare
+    # plain IDs rather than channel and user objects.
+    channel_id = context.channel.id
+    author_id = context.author.id
+
+    def input_check(msg: Message) -> bool:
+        """
+        Check if a message is a valid input from the command author.
+
+        :param msg: Message to check
+        :return: Whether the message is a valid input
+        """
+        return (
+                msg.channel.id == channel_id
+                and msg.author.id == author_id
+                and check(msg.content)
+        )
+
     return await bot.wait_for(
         "message",
         timeout=timeout_seconds,
-        check=lambda msg: (
-                msg.channel == context.channel
-                and msg.author == context.author
-                and check(msg.content)
-        )
+        check=input_check
     )
 
 
+# noinspection PyUnresolvedReferences
+async def get_option_input(
+        bot: "OpheliaBot",
+        context: Context,
+        options: Dict[str, Any],
+        timeout_seconds: float
+) -> Tuple[Message, Any]:
+    """
+    Wait for user input matching one of the given options, ignoring
+    case.
+
+    :param bot: Ophelia bot instance
+    :param context: Command context
+    :param options: Dictionary of options indexed by user response
+        strings
+    :param timeout_seconds: Seconds to timeout
+    :return: Tuple of user input message and the selected option
+    """
+    folded_options = {key.casefold(): value for key, value in options.items()}
+    selection: Dict[str, Any] = {}
+
+    def valid_option(option_text: str) -> bool:
+        """
+        Evaluates if text input is one of the options, keeping track of
+        the selected option so that the input doesn't have to be
+        casefolded again.
+
+        :param option_text: User input
+        :return: Whether input text is a valid option
+        """
+        folded_text = option_text.casefold()
+        if folded_text not in folded_options:
+            return False
+
+        selection["option"] = folded_options[folded_text]
+        return True
+
+    user_input = await get_input(bot, context, timeout_seconds, valid_option)
+    return user_input, selection["option"]
+
+
 # noinspection PyUnresolvedReferences
 async def response_switch(
         bot: "OpheliaBot",
@@ -387,15 +575,15 @@ async def response_switch(
     :param delete_response: Whether to delete user response
     """
     try:
-        user_input = await get_input(
+        user_input, option_call = await get_option_input(
             bot,
             context,
-            timeout_seconds,
-            lambda c: c.casefold() in options
+            options,
+            timeout_seconds
         )
 
         await try_del(delete_message, delete_response, message, user_input)
-        await options[user_input.content.casefold()](context=context)
+        await option_call(context=context)
 
     except asyncio.TimeoutError as e:
         raise timeout_exception from e
@@ -429,18 +617,15 @@ async def response_options(
     :param delete_response: Whether to delete user response
     """
     try:
-        user_input = await get_input(
+        user_input, option_kwargs = await get_option_input(
             bot,
             context,
-            timeout_seconds,
-            lambda c: c.casefold() in options
+            options,
+            timeout_seconds
         )
 
         await try_del(delete_message, delete_response, message, user_input)
-        await response_call(
-            context=context,
-            **options[user_input.content.casefold()]
-        )
+        await response_call(context=context, **option_kwargs)
 
     except asyncio.TimeoutError as e:
         raise timeout_exception from e
@@ -534,34 +719,75 @@ async def response_yaml(
     :param delete_message: Whether to delete the original bot message
     :param delete_response: Whether to delete the user response
     """
-    yaml_output: dict = {}
-
-    def valid_yaml(yaml_text: str) -> bool:
+    def maybe_yaml(yaml_text: str) -> bool:
         """
-        Evaluates if text input is valid yaml.
+        Cheaply evaluates if text input could be a valid yaml mapping.
+
+        Only mappings are accepted, so anything without a key-value
+        separator, as well as overly long messages, can be skipped
+        without parsing.
 
         :param yaml_text: YAML input
-        :return: Whether input text is valid yaml
+        :return: Whether input text might be a valid yaml mapping
         """
-        try:
-            yaml_output.clear()
-            yaml_output.update(yaml.safe_load(yaml_text))
+        return len(yaml_text) <= MAX_YAML_INPUT_LENGTH and ":" in yaml_text
 
-            if key_set is None or set(yaml_output.keys()).issubset(key_set):
-                return True
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    try:
+        while True:
+            user_input = await get_input(
+                bot,
+                context,
+                deadline - loop.time(),
+                maybe_yaml
+            )
 
-            return False
-        except yaml.YAMLError:
-            return False
+            yaml_output = await parse_yaml_input(user_input.content, key_set)
+            if yaml_output is not None:
+                break
 
-    try:
-        user_input = await get_input(bot, context, timeout_seconds, valid_yaml)
         await try_del(delete_message, delete_response, message, user_input)
         await response_call(yaml_output=yaml_output, context=context)
     except asyncio.TimeoutError as e:
         raise timeout_exception from e
 
 
+async def parse_yaml_input(
+        yaml_text: str,
+        key_set: Optional[Set[str]]
+) -> Optional[dict]:
+    """
+    Parse a yaml mapping from user input.
+
+    Long inputs are parsed in a worker thread so that they don't block
+    the event loop.
+
+    :param yaml_text: YAML input
+    :param key_set: Set of accepted keys, or None to accept any key
+    :return: Parsed mapping, or None if the input is not a valid yaml
+        mapping with accepted keys
+    """
+    try:
+        if len(yaml_text) > YAML_EXECUTOR_THRESHOLD:
+            yaml_output = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(yaml.load, yaml_text, Loader=YAML_LOADER)
+            )
+        else:
+            yaml_output = yaml.load(yaml_text, Loader=YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+
+    if not isinstance(yaml_output, dict):
+        return None
+
+    if key_set is not None and not set(yaml_output.keys()).issubset(key_set):
+        return None
+
+    return yaml_output
+
+
 class ResponseConfigException(Exception):
     """
     When a user input string for a single response config variable
@@ -638,9 +864,11 @@ async def response_config(
 
         for try_num in range(response_tries):
             try:
-                # If this is not the first try
+                # If this is not the first try, reuse the prompt for the
+                # error message instead of sending a new one
                 if try_num:
-                    prompt = await send_error_embed(
+                    prompt = await edit_error_embed(
+                        message=prompt,
                         channel=context,
                         title=disp_str("config_try_again_title").format(key),
                         desc=disp_str("config_try_again_desc").format(
@@ -656,15 +884,11 @@ async def response_config(
                     user_input=user_input.content
                 )
 
-                await try_del(
-                    delete_message,
-                    delete_response,
-                    prompt,
-                    user_input
-                )
+                await try_del(False, delete_response, prompt, user_input)
 
                 if converted is not None:
                     config_vars[key] = converted
+                    await try_del(delete_message, False, prompt)
                     break
 
             except asyncio.TimeoutError as e:
@@ -672,6 +896,7 @@ async def response_config(
         else:
             # This runs when the for completes without breaking, i.e.
             # The user exceeded the maximum number of tries
+            await try_del(delete_message, False, prompt)
             raise timeout_exception
 
     # Successfully configured all items
@@ -715,32 +940,29 @@ async def response_param(
         :param input_text: Param: value input
         :return: Whether input text is valid
         """
-        if ":" not in input_text:
-            return False
         # We assume that the user has attempted to modify multiple
         # parameters and reject it
         if "\n" in input_text:
-            return True
+            return False
 
-        split_input = input_text.split(":")
-        key = split_input[0].strip()
+        key, separator, value = input_text.partition(":")
+        if not separator:
+            return False
 
+        key = key.strip()
         if key in key_set:
             output["name"] = key
-            output["value"] = ":".join(split_input[0:]).strip()
+            output["value"] = value.strip()
             return True
 
         return False
 
     try:
-        user_input = await bot.wait_for(
-            "message",
-            timeout=timeout_seconds,
-            check=lambda msg: (
-                    msg.channel == context.channel
-                    and msg.author == context.author
-                    and valid_input(msg.content)
-            )
+        user_input = await get_input(
+            bot,
+            context,
+            timeout_seconds,
+            valid_input
         )
 
         await try_del(delete_message, delete_response, message, user_input)
@@ -19,7 +19,7 @@ be readable enough to justify shutting pylint up for this.
 
 import asyncio
 import re
-from typing import Callable, Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import emoji
 import yaml
@@ -51,12 +51,13 @@ from ophelia.utils.discord_utils import (
     filter_self_react
 )
 from ophelia.utils.text_utils import (
-    EMOTE_REGEX, extract_emoji, is_possibly_emoji
+    EMOTE_PATTERN, extract_emoji, is_possibly_emoji
 )
 
 DM_TIMEOUT = settings.long_timeout
 COMMAND_TIMEOUT = settings.short_timeout
 YAML_TIMEOUT = settings.long_timeout
+MESSAGE_FETCH_CONCURRENCY = 10
 
 
 class ReactroleCog(commands.Cog, name="reactrole"):
@@ -160,8 +161,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         :param raw_bulk_message_delete: Raw deletion event
         """
-        for message_id in raw_bulk_message_delete.message_ids:
-            await self.delete_message(message_id)
+        await self.config.delete_messages(raw_bulk_message_delete.message_ids)
 
     @staticmethod
     async def command_cancel(context: Context) -> None:
@@ -218,21 +218,23 @@ class ReactroleCog(commands.Cog, name="reactrole"):
         :raises ConvertFailureException: When user input is not a valid
             message ID
         """
-        if not user_input.isnumeric():
+        # Only ASCII digits, which int() always accepts
+        if not (user_input.isascii() and user_input.isdigit()):
             raise ConvertFailureException
 
-        try:
-            message_id = int(user_input)
-            channel: TextChannel = context.channel
+        message_id = int(user_input)
+        channel: TextChannel = context.channel
 
-            try:
-                message = await channel.fetch_message(message_id)
-                return message
-            except FETCH_FAIL_EXCEPTIONS:
-                raise ConvertNotFoundException
+        # Use the message cache when the message was seen recently
+        message = context.bot.get_message(message_id)
+        if message is not None and message.channel.id == channel.id:
+            return message
 
-        except ValueError as e:
-            raise ConvertFailureException from e
+        try:
+            message = await channel.fetch_message(message_id)
+            return message
+        except FETCH_FAIL_EXCEPTIONS:
+            raise ConvertNotFoundException
 
     async def retrieve_emoji(
             self,
@@ -281,28 +283,56 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         # Filter fetchable channels
         fetchable_channels: Dict[int, TextChannel] = {
-            channel.id: channel
-            for channel in await guild.fetch_channels()
-            if isinstance(channel, TextChannel)
+            channel.id: channel for channel in guild.text_channels
         }
 
         fetchable_message_configs: Dict[str, MessageConfig] = {}
         unfetchable_message_configs: Dict[str, MessageConfig] = {}
         fetchable_messages: Dict[str, Message] = {}
 
-        message_config: MessageConfig
-        for message_id_str, message_config in message_configs.items():
-            if message_config.channel_id not in fetchable_channels:
-                unfetchable_message_configs[message_id_str] = message_config
-                continue
+        # Fetch messages concurrently, but not too many at once to stay
+        # clear of rate limits
+        semaphore = asyncio.Semaphore(MESSAGE_FETCH_CONCURRENCY)
 
-            channel = fetchable_channels[message_config.channel_id]
-            try:
-                message = await channel.fetch_message(int(message_id_str))
+        async def fetch(
+                message_id_str: str,
+                message_config: MessageConfig
+        ) -> Optional[Message]:
+            """
+            Fetches the message of a message config.
+
+            :param message_id_str: Message ID as a string
+            :param message_config: Message config of the message
+            :return: Discord message, or None if it cannot be fetched
+            """
+            channel = fetchable_channels.get(message_config.channel_id)
+            if channel is None:
+                return None
+
+            message = self.bot.get_message(int(message_id_str))
+            if message is not None:
+                return message
+
+            async with semaphore:
+                try:
+                    return await channel.fetch_message(int(message_id_str))
+                except FETCH_FAIL_EXCEPTIONS:
+                    return None
+
+        messages = await asyncio.gather(*(
+            fetch(message_id_str, message_config)
+            for message_id_str, message_config in message_configs.items()
+        ))
+
+        for (message_id_str, message_config), message in zip(
+                message_configs.items(),
+                messages
+        ):
+            if message is None:
+                unfetchable_message_configs[message_id_str] = message_config
+            else:
                 fetchable_message_configs[message_id_str] = message_config
                 fetchable_messages[message_id_str] = message
-            except FETCH_FAIL_EXCEPTIONS:
-                unfetchable_message_configs[message_id_str] = message_config
 
         return (
             fetchable_message_configs,
@@ -311,7 +341,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
         )
 
     @staticmethod
-    async def print_message_configs(configs: Dict[str, MessageConfig]) -> str:
+    def print_message_configs(configs: Dict[str, MessageConfig]) -> str:
         """
         Get a user-friendly list of message configs.
 
@@ -322,11 +352,15 @@ class ReactroleCog(commands.Cog, name="reactrole"):
         if not configs:
             return disp_str("reactrole_cmd_no_messages_found")
 
-        return "\n".join(
-            f"> **{message_id_str}** "
-            f"| {len(config.reacts)} Reaction{'s' * (len(config.reacts) != 1)}"
-            for message_id_str, config in configs.items()
-        )
+        lines = []
+        for message_id_str, config in configs.items():
+            reacts_count = len(config.reacts)
+            lines.append(
+                f"> **{message_id_str}** | {reacts_count} "
+                f"Reaction{'' if reacts_count == 1 else 's'}"
+            )
+
+        return "\n".join(lines)
 
     async def command_add_reaction(self, context: Context) -> None:
         """
@@ -367,8 +401,8 @@ class ReactroleCog(commands.Cog, name="reactrole"):
         message = await send_embed(
             channel=context,
             embed_text=disp_str("reactrole_cmd_delete_reaction_desc").format(
-                await self.print_message_configs(fetchable),
-                await self.print_message_configs(unfetchable)
+                self.print_message_configs(fetchable),
+                self.print_message_configs(unfetchable)
             ),
             title=disp_str("reactrole_cmd_delete_reaction_title"),
             timestamp=None,
@@ -377,14 +411,14 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         options = {}
         for message_id_str in fetchable:
-            options[message_id_str] = await self.gen_command_delete_message(
+            options[message_id_str] = self.gen_command_delete_message(
                 messages[message_id_str]
             )
 
         for message_id_str in unfetchable:
             options[
                 message_id_str
-            ] = await self.gen_command_delete_invalid_message(
+            ] = self.gen_command_delete_invalid_message(
                 message_id_str
             )
 
@@ -410,8 +444,8 @@ class ReactroleCog(commands.Cog, name="reactrole"):
         sent_message = await send_embed(
             channel=context,
             embed_text=disp_str("reactrole_cmd_view_reaction_desc").format(
-                await self.print_message_configs(fetchable),
-                await self.print_message_configs(unfetchable)
+                self.print_message_configs(fetchable),
+                self.print_message_configs(unfetchable)
             ),
             title=disp_str("reactrole_cmd_view_reaction_title"),
             timestamp=None,
@@ -420,13 +454,13 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         options = {}
         for message_id_str in fetchable:
-            options[message_id_str] = await self.gen_command_view_yaml(
+            options[message_id_str] = self.gen_command_view_yaml(
                 messages[message_id_str]
             )
         for message_id_str in unfetchable:
             options[
                 message_id_str
-            ] = await self.gen_command_delete_invalid_message(
+            ] = self.gen_command_delete_invalid_message(
                 message_id_str
             )
 
@@ -466,14 +500,14 @@ class ReactroleCog(commands.Cog, name="reactrole"):
             context=context,
             message=sent_message,
             options={
-                "1": await self.gen_command_add_simple_reaction(message),
-                "2": await self.gen_command_add_dm_emote(message)
+                "1": self.gen_command_add_simple_reaction(message),
+                "2": self.gen_command_add_dm_emote(message)
             },
             timeout_seconds=COMMAND_TIMEOUT,
             timeout_exception=OpheliaCommandError("reactrole_cmd_exit")
         )
 
-    async def gen_command_add_simple_reaction(
+    def gen_command_add_simple_reaction(
             self,
             message: Message
     ) -> Callable:
@@ -505,7 +539,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 context=context,
                 message=sent_message,
                 key_set=None,
-                response_call=await self.gen_command_add_simple_confirm(
+                response_call=self.gen_command_add_simple_confirm(
                     message
                 ),
                 timeout_seconds=YAML_TIMEOUT,
@@ -515,7 +549,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
         return func
 
     # pylint: disable=too-many-branches
-    async def gen_command_add_simple_confirm(
+    def gen_command_add_simple_confirm(
             self,
             message: Message
     ) -> Callable:
@@ -537,7 +571,11 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 reaction role configuration
             :param context: Command context
             """
-            add_pile: List[Tuple[Union[str, Emoji], Role]] = []
+            # The emotes to react with, their config representations
+            # and the result lines, filled in together while parsing
+            add_emotes: List[Union[str, Emoji]] = []
+            reactions: List[Tuple[str, int]] = []
+            add_message_list: List[str] = []
             discard_pile = []
             for emote_repr, role_repr in yaml_output.items():
                 if not isinstance(emote_repr, str):
@@ -555,11 +593,13 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 # that'd be inefficient, but the algorithm for getting
                 # the emotes is basically the same here.
                 if emote_repr in emoji.EMOJI_UNICODE_ENGLISH:
-                    add_pile.append((emote_repr, role))
+                    add_emotes.append(emote_repr)
+                    reactions.append((emote_repr, role.id))
+                    add_message_list.append(f"{emote_repr}: {role.name}")
                     continue
 
                 # Check if emote matches the Discord Emote format
-                matches = re.search(EMOTE_REGEX, emote_repr)
+                matches = EMOTE_PATTERN.search(emote_repr)
                 if matches:
                     emote_id = int(matches.group(1))
                 elif emote_repr.isnumeric():
@@ -573,34 +613,24 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 if emote is None:
                     discard_pile.append((emote_repr, role_repr))
                 else:
-                    add_pile.append((emote, role))
+                    add_emotes.append(emote)
+                    reactions.append((str(emote.id), role.id))
+                    add_message_list.append(f"{emote.name}: {role.name}")
 
             # Try adding the reactions first
             try:
-                for emote, _ in add_pile:
+                for emote in add_emotes:
                     await message.add_reaction(emote)
             except ARGUMENT_FAIL_EXCEPTIONS as e:
                 raise OpheliaCommandError("reactrole_cmd_react_failed") from e
 
             # Add the config later
-            add_message_list = []
-            for emote, role in add_pile:
-                if isinstance(emote, Emoji):
-                    emote_repr = str(emote.id)
-                    emote_name = emote.name
-                else:
-                    emote_repr = str(emote)
-                    emote_name = emote_repr
-
-                add_message_list.append(f"{emote_name}: {role.name}")
-
-                await self.config.add_simple_reaction(
-                    message_id=message.id,
-                    guild_id=message.guild.id,
-                    channel_id=message.channel.id,
-                    emote=emote_repr,
-                    role_id=role.id
-                )
+            await self.config.add_simple_reactions(
+                message_id=message.id,
+                guild_id=message.guild.id,
+                channel_id=message.channel.id,
+                reactions=reactions
+            )
 
             # Print add result
             await send_embed(
@@ -624,7 +654,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
     # pylint: enable=too-many-branches
 
-    async def gen_command_add_dm_emote(self, message: Message) -> Callable:
+    def gen_command_add_dm_emote(self, message: Message) -> Callable:
         """
         First order function for adding a DM reaction to a message.
 
@@ -652,7 +682,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 message=sent_message,
                 check_call=is_possibly_emoji,
                 conversion_call=self.retrieve_emoji,
-                success_call=await self.gen_command_add_dm_config(message),
+                success_call=self.gen_command_add_dm_config(message),
                 notfound_exception=OpheliaCommandError(
                     "reactrole_cmd_invalid_arg"
                 ),
@@ -665,7 +695,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_add_dm_config(
+    def gen_command_add_dm_config(
             self,
             message: Message,
     ) -> Callable:
@@ -697,7 +727,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 context=context,
                 message=sent_message,
                 key_set={"dm_msg", "dm_regex", "dm_roles"},
-                response_call=await self.gen_command_add_dm_confirm(
+                response_call=self.gen_command_add_dm_confirm(
                     message=message,
                     emote=emote
                 ),
@@ -707,7 +737,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_add_dm_confirm(
+    def gen_command_add_dm_confirm(
             self,
             message: Message,
             emote: Union[str, Emoji]
@@ -778,7 +808,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_delete_message(self, message: Message) -> Callable:
+    def gen_command_delete_message(self, message: Message) -> Callable:
         """
         First order function to prompt the user to confirm the deletion
         of all reaction roles from a message.
@@ -815,7 +845,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 context=context,
                 message=sent_message,
                 options={
-                    "y": await self.gen_command_delete_confirm(message),
+                    "y": self.gen_command_delete_confirm(message),
                     "n": self.command_cancel
                 },
                 timeout_seconds=COMMAND_TIMEOUT,
@@ -824,7 +854,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_delete_confirm(self, message: Message) -> Callable:
+    def gen_command_delete_confirm(self, message: Message) -> Callable:
         """
         First order function for performing deletion of message config
 
@@ -847,10 +877,11 @@ class ReactroleCog(commands.Cog, name="reactrole"):
             # because the only error that can happen here would be an
             # internal error that's out of the user's control, and that
             # is already handled by the bot's internal error message
-            for reaction in message.reactions:
-                users = await reaction.users().flatten()
-                if self.bot.user in users:
-                    await reaction.remove(self.bot.user)
+            await asyncio.gather(*(
+                reaction.remove(self.bot.user)
+                for reaction in message.reactions
+                if reaction.me
+            ))
 
             # Confirmation message
             await send_embed(
@@ -866,7 +897,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_view_yaml(self, message: Message) -> Callable:
+    def gen_command_view_yaml(self, message: Message) -> Callable:
         """
         First order function for displaying the current message role
         reaction config (raw YAML) for the given message.
@@ -897,7 +928,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_delete_invalid_message(
+    def gen_command_delete_invalid_message(
             self,
             message_id_str: str
     ) -> Callable:
@@ -939,7 +970,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
                 context=context,
                 message=sent_message,
                 options={
-                    "y": await self.gen_command_delete_invalid_confirm(
+                    "y": self.gen_command_delete_invalid_confirm(
                         message_id_str
                     ),
                     "n": self.command_cancel
@@ -950,7 +981,7 @@ class ReactroleCog(commands.Cog, name="reactrole"):
 
         return func
 
-    async def gen_command_delete_invalid_confirm(
+    def gen_command_delete_invalid_confirm(
             self,
             message_id_str: str
     ) -> Callable:
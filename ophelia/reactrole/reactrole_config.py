@@ -13,14 +13,16 @@ reaction configuration mess.
 import asyncio
 import os
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import yaml
 from loguru import logger
 
 from ophelia import settings
+from ophelia.utils.yaml_utils import YAML_DUMPER, YAML_LOADER
 
 CONFIG_PATH = settings.file_reactrole_config
+SAVE_DELAY_SECONDS = 1
 
 
 class InvalidMessageConfigException(Exception):
@@ -203,13 +205,14 @@ class ReactroleConfig:
             - <role_id>
     """
 
-    __slots__ = ["message_configs", "config_dict", "lock"]
+    __slots__ = ["message_configs", "config_dict", "lock", "save_task"]
 
     def __init__(self) -> None:
         """Initializer for the ReactroleConfig class."""
         logger.debug("Initializing reaction role config.")
         self.message_configs, self.config_dict = self.parse_config()
         self.lock = asyncio.Lock()
+        self.save_task: Optional[asyncio.Task] = None
 
     @staticmethod
     def parse_config() -> Tuple[dict, dict]:
@@ -219,7 +222,7 @@ class ReactroleConfig:
 
         filtered_settings_dict = {}
         with open(CONFIG_PATH, "r", encoding="utf-8") as file:
-            settings_dict = yaml.safe_load(file)
+            settings_dict = yaml.load(file, Loader=YAML_LOADER)
 
             message_configs = {}
             for message_id_str, message_dict in settings_dict.items():
@@ -256,9 +259,37 @@ class ReactroleConfig:
             yaml.dump(
                 self.config_dict,
                 save_target,
+                Dumper=YAML_DUMPER,
                 default_flow_style=False
             )
 
+    def schedule_save(self) -> None:
+        """
+        Schedule a save of the config yaml file.
+
+        Changes made before the scheduled save runs are written
+        together with it, so bursts of changes only write the file
+        once.
+        """
+        if self.save_task is None or self.save_task.done():
+            self.save_task = asyncio.create_task(self.delayed_save())
+
+    async def delayed_save(self) -> None:
+        """
+        Save config yaml file after a short delay.
+
+        This runs as a detached task, so failures are logged here
+        instead of being raised to the caller that changed the config.
+        """
+        await asyncio.sleep(SAVE_DELAY_SECONDS)
+        async with self.lock:
+            try:
+                await self.save_file()
+            except (OSError, yaml.YAMLError):
+                logger.opt(exception=True).error(
+                    "Failed to save reaction role config"
+                )
+
     async def add_message(
             self,
             message_id: int,
@@ -283,39 +314,42 @@ class ReactroleConfig:
         self.config_dict[message_id_str]["channel"] = channel_id
         self.config_dict[message_id_str]["reacts"] = dict()
 
-    async def add_simple_reaction(
+    async def add_simple_reactions(
             self,
             message_id: int,
             guild_id: int,
             channel_id: int,
-            emote: str,
-            role_id: int
+            reactions: List[Tuple[str, int]]
     ) -> None:
         """
-        Add simple role reaction to message.
+        Add simple role reactions to message and save the config file
+        once.
 
         :param message_id: ID of message
         :param guild_id: ID of guild containing message
         :param channel_id: ID of channel containing message
-        :param emote: String representation of emote
-        :param role_id: ID of role to assign
+        :param reactions: List of tuples of emote string representations
+            and the IDs of roles to assign
         """
+        if not reactions:
+            return
+
         async with self.lock:
             message_id_str = str(message_id)
             if message_id_str not in self.message_configs:
                 await self.add_message(message_id, guild_id, channel_id)
 
             message_config = self.message_configs[message_id_str]
+            reacts_dict = self.config_dict[message_id_str]["reacts"]
             async with message_config.lock:
-                message_config.reacts[str(emote)] = SingleRoleConfig(emote,
-                                                                     role_id)
-
-            message_id_str = str(message_id)
-            self.config_dict[message_id_str]["reacts"][emote] = {}
-            react_config = self.config_dict[message_id_str]["reacts"][emote]
-            react_config["role"] = role_id
+                for emote, role_id in reactions:
+                    message_config.reacts[str(emote)] = SingleRoleConfig(
+                        emote,
+                        role_id
+                    )
+                    reacts_dict[emote] = {"role": role_id}
 
-            await self.save_file()
+            self.schedule_save()
 
     async def add_dm_reaction(
             self,
@@ -373,7 +407,7 @@ class ReactroleConfig:
             if dm_roles is not None:
                 react_config["dm_roles"] = dm_roles
 
-            await self.save_file()
+            self.schedule_save()
 
     async def delete_message(self, message_id: Union[int, str]) -> None:
         """
@@ -386,7 +420,29 @@ class ReactroleConfig:
             del self.message_configs[message_id_str]
             del self.config_dict[message_id_str]
 
-            await self.save_file()
+            self.schedule_save()
+
+    async def delete_messages(
+            self,
+            message_ids: Iterable[Union[int, str]]
+    ) -> None:
+        """
+        Delete the configs of multiple messages, skipping messages
+        without a config, and save the config file once.
+
+        :param message_ids: IDs of messages
+        """
+        async with self.lock:
+            deleted = False
+            for message_id in message_ids:
+                message_id_str = str(message_id)
+                if message_id_str in self.message_configs:
+                    del self.message_configs[message_id_str]
+                    del self.config_dict[message_id_str]
+                    deleted = True
+
+            if deleted:
+                self.schedule_save()
 
     async def delete_reaction(
             self,
@@ -408,8 +464,10 @@ class ReactroleConfig:
             del_message = False
             async with message_config.lock:
                 emote_str = str(emote)
-                if emote_str in message_config.reacts:
-                    del message_config.reacts[emote_str]
+                if emote_str not in message_config.reacts:
+                    return
+
+                del message_config.reacts[emote_str]
 
                 if not message_config.reacts:
                     del_message = True
@@ -419,7 +477,7 @@ class ReactroleConfig:
             else:
                 del self.config_dict[message_id_str]["reacts"][emote]
 
-            await self.save_file()
+            self.schedule_save()
 
     async def list_guild_message_configs(
             self,
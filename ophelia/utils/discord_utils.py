@@ -183,6 +183,23 @@ async def extract_voice_config(
     return None
 
 
+async def resolve_member(guild: Guild, member_id: int) -> Member:
+    """
+    Get a guild member from the member cache, only fetching the member
+    from Discord if they are not cached.
+
+    :param guild: Guild to search for the member in
+    :param member_id: Member ID
+    :return: Guild member
+    :raises FETCH_FAIL_EXCEPTIONS: Member could not be fetched
+    """
+    member = guild.get_member(member_id)
+    if member is None:
+        member = await guild.fetch_member(member_id)
+
+    return member
+
+
 def filter_self_react(func: Callable) -> Callable:
     """
     Decorator for checking if reaction event was sent by someone who is
@@ -16,6 +16,7 @@ HTTP_REGEX = (
     r"[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)"
 )
 EMOTE_REGEX = r"<a?:[A-Za-z0-9-_]*:([0-9]+)>"
+EMOTE_PATTERN = re.compile(EMOTE_REGEX)
 
 
 async def stringify(
@@ -192,7 +193,7 @@ def is_possibly_emoji(string: str) -> bool:
     if emote_repr in emoji.EMOJI_UNICODE_ENGLISH:
         return True
 
-    matches = re.search(EMOTE_REGEX, emote_repr)
+    matches = EMOTE_PATTERN.search(emote_repr)
     if matches:
         return True
     if emote_repr.isnumeric():
@@ -215,7 +216,7 @@ def extract_emoji(string: str, bot: Bot) -> Optional[Union[str, Emoji]]:
     if emote_repr in emoji.EMOJI_UNICODE_ENGLISH:
         return emote_repr
 
-    matches = re.search(EMOTE_REGEX, emote_repr)
+    matches = EMOTE_PATTERN.search(emote_repr)
     if matches:
         emote_id = int(matches.group(1))
     elif emote_repr.isnumeric():
@@ -0,0 +1,7 @@
+"""YAML utils module."""
+
+import yaml
+
+# Use the libyaml safe loader and dumper if PyYAML was built with it
+YAML_LOADER = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+YAML_DUMPER = yaml.CSafeDumper if yaml.__with_libyaml__ else yaml.SafeDumper
@@ -42,12 +42,11 @@ class MessageBuffer:
         """
 
         log_list = list()
-        log_list.append(disp_str("voicerooms_log_header").format(
-            time=message.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            channel=message.channel.name,
-            name=escape_formatting(message.author.name),
-            discrim=message.author.discriminator,
-            id=message.author.id
+        log_list.append(disp_str("voicerooms_log_header") % (
+            message.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            message.channel.name,
+            escape_formatting(message.author.name),
+            message.author.id
         ))
 
         if message.attachments: